@@ -1,30 +1,29 @@
-import json, statistics
+import statistics
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'scripts'))
+from parse_logs import list_subdirs, load_last_event
+
 results = {}
-for cfg_dir in sorted(Path('output/logs').iterdir()):
-    if not cfg_dir.is_dir():
-        continue
+for cfg_dir in list_subdirs(Path('output/logs')):
     fd_algo, repl = '?', '?'
     lats = []
-    for trial_dir in sorted(cfg_dir.iterdir()):
-        if not trial_dir.is_dir():
-            continue
+    for trial_dir in list_subdirs(cfg_dir):
         inj = trial_dir / 'injector.jsonl'
         if not inj.exists():
             continue
-        for line in open(inj):
-            try:
-                e = json.loads(line)
-                if e.get('event') == 'run_start':
-                    fd_algo = e.get('fd_algo', '?')
-                    repl    = e.get('repl_mode', '?')
-                if e.get('event') == 'detection_result':
-                    lat = e.get('detection_latency_ms')
-                    if lat:
-                        lats.append(lat)
-            except Exception:
-                pass
+        # detection_result is the last record the injector writes, so only
+        # the first and last lines need to be decoded.
+        start = load_last_event(inj, 'run_start')
+        if start:
+            fd_algo = start.get('fd_algo', '?')
+            repl    = start.get('repl_mode', '?')
+        det = load_last_event(inj, 'detection_result')
+        if det:
+            lat = det.get('detection_latency_ms')
+            if lat:
+                lats.append(lat)
     if lats:
         results[cfg_dir.name] = {'fd': fd_algo, 'repl': repl, 'lats': lats}
 
@@ -19,25 +19,42 @@ Outputs:
 """
 
 import csv
+import hashlib
 import json
+import os
+import pickle
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the kernel below also runs as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda f: f
+
 # Allow importing parse_logs from same directory
 sys.path.insert(0, str(Path(__file__).resolve().parent))
-from parse_logs import load_trial_logs, filter_events, get_first_event
+from parse_logs import load_jsonl, filter_events, get_first_event, list_subdirs
+
+
+# Event types read from node0.jsonl / workload.jsonl by compute_trial_metrics
+NODE0_EVENTS = ("declared_dead", "repl_skipped", "wal_recovered")
+WORKLOAD_EVENTS = ("op_done", "stale_read")
 
 
 def compute_trial_metrics(trial_dir: Path) -> Dict[str, Any]:
     """Compute all metrics for a single trial."""
-    logs = load_trial_logs(trial_dir)
-    injector = logs["injector"]
-    node0 = logs["node0"]
-    workload = logs["workload"]
+    # Only decode the event types used below; node1's log is not needed here.
+    injector = load_jsonl(trial_dir / "injector.jsonl")
+    node0 = load_jsonl(trial_dir / "node0.jsonl", events=NODE0_EVENTS)
+    workload = load_jsonl(trial_dir / "workload.jsonl", events=WORKLOAD_EVENTS)
 
     metrics: Dict[str, Any] = {
         "trial_dir": str(trial_dir),
@@ -191,6 +208,171 @@ def compute_trial_metrics(trial_dir: Path) -> Dict[str, Any]:
     return metrics
 
 
+def _compute_trial_metrics_safe(trial_dir: Path) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Worker wrapper: return (metrics, None) or (None, error message)."""
+    try:
+        return compute_trial_metrics(trial_dir), None
+    except Exception as e:
+        return None, str(e)
+
+
+def trial_cache_key(trial_dir: Path) -> Tuple:
+    """Cheap change detector for a trial: (name, size, mtime_ns) of every file in it."""
+    with os.scandir(trial_dir) as it:
+        stats = [(e.name, e.stat()) for e in it if e.is_file()]
+    return tuple(sorted((name, st.st_size, st.st_mtime_ns) for name, st in stats))
+
+
+def _code_fingerprint() -> str:
+    """Hash of the metric code, so cached results are dropped when it changes."""
+    h = hashlib.sha1()
+    scripts_dir = Path(__file__).resolve().parent
+    for name in ("compute_metrics.py", "parse_logs.py"):
+        h.update((scripts_dir / name).read_bytes())
+    return h.hexdigest()
+
+
+def load_trial_cache(path: Path) -> Dict[str, Tuple[Tuple, Dict[str, Any]]]:
+    """Load cached per-trial metrics, or an empty cache if missing, stale or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("code") == _code_fingerprint():
+            return data["trials"]
+    except Exception:
+        pass
+    return {}
+
+
+def save_trial_cache(path: Path, trials: Dict[str, Tuple[Tuple, Dict[str, Any]]]):
+    """Write the per-trial metrics cache atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump({"code": _code_fingerprint(), "trials": trials}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def compute_all_trial_metrics(trial_dirs: List[Path], jobs: Optional[int] = None,
+                              cache_path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """
+    Compute metrics for many trials, fanning out over a process pool.
+
+    Log parsing is CPU-bound, so trials are spread across worker processes.
+    With cache_path, trials whose files are unchanged since the last run reuse
+    their cached metrics and only new or modified trials are parsed.
+    Results keep the order of trial_dirs; failed trials are reported and skipped.
+    """
+    cache = load_trial_cache(cache_path) if cache_path is not None else {}
+    # Cache entries are keyed by the trial path relative to logs/ (<config>/<trial>)
+    names = [f"{d.parent.name}/{d.name}" for d in trial_dirs]
+    keys = [trial_cache_key(d) for d in trial_dirs]
+    results: List[Tuple[Optional[Dict[str, Any]], Optional[str]]] = [None] * len(trial_dirs)
+    todo = []
+    for i, (trial_dir, name, key) in enumerate(zip(trial_dirs, names, keys)):
+        hit = cache.get(name)
+        if hit is not None and hit[0] == key:
+            metrics = dict(hit[1])
+            metrics["trial_dir"] = str(trial_dir)
+            results[i] = (metrics, None)
+        else:
+            todo.append(i)
+
+    jobs = jobs or os.cpu_count() or 1
+    todo_dirs = [trial_dirs[i] for i in todo]
+    if jobs <= 1 or len(todo_dirs) <= 1:
+        computed = [_compute_trial_metrics_safe(d) for d in todo_dirs]
+    else:
+        chunksize = max(1, len(todo_dirs) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            computed = list(ex.map(_compute_trial_metrics_safe, todo_dirs, chunksize=chunksize))
+    for i, res in zip(todo, computed):
+        results[i] = res
+
+    if cache_path is not None:
+        if todo:
+            print(f"Parsed {len(todo)} new or changed trials "
+                  f"({len(trial_dirs) - len(todo)} cached)")
+        new_cache = {name: (key, metrics)
+                     for name, key, (metrics, err) in zip(names, keys, results)
+                     if err is None}
+        if todo or new_cache.keys() != cache.keys():
+            save_trial_cache(cache_path, new_cache)
+
+    all_metrics = []
+    for trial_dir, (metrics, err) in zip(trial_dirs, results):
+        if err is not None:
+            print(f"  Error processing {trial_dir}: {err}", file=sys.stderr)
+            continue
+        all_metrics.append(metrics)
+    return all_metrics
+
+
+# Numeric per-trial fields summarised in aggregate.csv
+AGGREGATE_FIELDS = [
+    "detection_latency_ms", "downtime_ms",
+    "write_latency_median_us", "write_latency_p95_us",
+    "throughput_ops_sec", "false_positives", "repl_skipped_count",
+    "stale_read_count", "stale_read_rate",          # NEW
+    "hot_key_latency_median_us", "cold_key_latency_median_us",  # NEW
+]
+
+# Write buffer for result CSVs; rows are written in one writerows() call
+CSV_BUFFER_SIZE = 1 << 20
+
+# Percentiles computed per group: min, Q1, median, Q3, max
+GROUP_PERCENTILES = [0, 25, 50, 75, 100]
+
+
+@njit(parallel=True, cache=True)
+def _sorted_group_percentiles(sorted_vals, starts, counts, qs, out):
+    """
+    Fill out[k] with the percentiles qs of sorted_vals[starts[k]:starts[k] + counts[k]].
+
+    Each slice must already be sorted. Uses the same linear interpolation as
+    np.percentile, so results match it exactly.
+    """
+    for k in prange(len(starts)):
+        n = counts[k]
+        base = starts[k]
+        for qi in range(len(qs)):
+            pos = (n - 1) * qs[qi] / 100.0
+            lo = int(np.floor(pos))
+            hi = min(lo + 1, n - 1)
+            t = pos - lo
+            a = sorted_vals[base + lo]
+            b = sorted_vals[base + hi]
+            if t >= 0.5:
+                out[k, qi] = b - (b - a) * (1.0 - t)
+            else:
+                out[k, qi] = a + (b - a) * t
+
+
+def grouped_percentiles(group_ids: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Compute GROUP_PERCENTILES of values for every group in one sort.
+
+    group_ids holds a group index in [0, n_groups) per value; NaN values are
+    ignored. Returns an (n_groups, len(GROUP_PERCENTILES)) array, NaN rows
+    for groups with no values.
+    """
+    out = np.full((n_groups, len(GROUP_PERCENTILES)), np.nan)
+    ok = ~np.isnan(values)
+    gids, vals = group_ids[ok], values[ok]
+    if vals.size == 0:
+        return out
+    # Sort by group, then by value, so each group is a contiguous sorted slice
+    order = np.lexsort((vals, gids))
+    gids, vals = gids[order], vals[order]
+    groups, starts, counts = np.unique(gids, return_index=True, return_counts=True)
+    stats = np.empty((len(groups), len(GROUP_PERCENTILES)))
+    _sorted_group_percentiles(vals, starts, counts,
+                              np.asarray(GROUP_PERCENTILES, dtype=np.float64), stats)
+    out[groups] = stats
+    return out
+
+
 def aggregate_metrics(all_metrics: List[Dict]) -> List[Dict]:
     """
     Aggregate trial metrics by configuration.
@@ -201,8 +383,25 @@ def aggregate_metrics(all_metrics: List[Dict]) -> List[Dict]:
         cfg = m.get("config", "unknown")
         by_config[cfg].append(m)
 
+    config_names = sorted(by_config)
+    config_index = {name: i for i, name in enumerate(config_names)}
+    n = len(all_metrics)
+    group_ids = np.fromiter((config_index[m.get("config", "unknown")] for m in all_metrics),
+                            dtype=np.int64, count=n)
+
+    # (trial x field) matrix built in one conversion; missing values become NaN
+    values = np.array([[m.get(f) for f in AGGREGATE_FIELDS] for m in all_metrics],
+                      dtype=float).reshape(n, len(AGGREGATE_FIELDS))
+
+    # Percentiles for every (field, config) pair, one sort per field
+    field_stats = {
+        field: grouped_percentiles(group_ids, values[:, j], len(config_names))
+        for j, field in enumerate(AGGREGATE_FIELDS)
+    }
+
     aggregated = []
-    for config_name, trials in sorted(by_config.items()):
+    for gi, config_name in enumerate(config_names):
+        trials = by_config[config_name]
         row = {
             "config": config_name,
             "n_trials": len(trials),
@@ -213,22 +412,13 @@ def aggregate_metrics(all_metrics: List[Dict]) -> List[Dict]:
         }
 
         # Aggregate numeric fields
-        numeric_fields = [
-            "detection_latency_ms", "downtime_ms",
-            "write_latency_median_us", "write_latency_p95_us",
-            "throughput_ops_sec", "false_positives", "repl_skipped_count",
-            "stale_read_count", "stale_read_rate",          # NEW
-            "hot_key_latency_median_us", "cold_key_latency_median_us",  # NEW
-        ]
-        for field in numeric_fields:
-            values = [m[field] for m in trials if m.get(field) is not None]
-            if values:
-                arr = np.array(values, dtype=float)
-                row[f"{field}_median"] = float(np.median(arr))
-                q1, q3 = np.percentile(arr, [25, 75])
+        for field in AGGREGATE_FIELDS:
+            p_min, q1, median, q3, p_max = field_stats[field][gi]
+            if not np.isnan(median):
+                row[f"{field}_median"] = float(median)
                 row[f"{field}_iqr"] = float(q3 - q1)
-                row[f"{field}_min"] = float(np.min(arr))
-                row[f"{field}_max"] = float(np.max(arr))
+                row[f"{field}_min"] = float(p_min)
+                row[f"{field}_max"] = float(p_max)
             else:
                 row[f"{field}_median"] = None
                 row[f"{field}_iqr"] = None
@@ -262,11 +452,10 @@ def write_summary_csv(metrics: List[Dict], path: Path):
         "false_positives", "repl_skipped_count",
     ]
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", newline="") as f:
+    with open(path, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
         writer.writeheader()
-        for m in metrics:
-            writer.writerow(m)
+        writer.writerows(metrics)
     print(f"Wrote {path}")
 
 
@@ -276,67 +465,58 @@ def write_aggregate_csv(aggregated: List[Dict], path: Path):
         return
     fieldnames = list(aggregated[0].keys())
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", newline="") as f:
+    with open(path, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
         writer.writeheader()
-        for row in aggregated:
-            writer.writerow(row)
+        writer.writerows(aggregated)
     print(f"Wrote {path}")
 
 
-def write_heatmap_csv(aggregated: List[Dict], path: Path):
-    """Write heatmap-format CSV for detection latency visualization."""
-    rows = [r for r in aggregated if r.get("detection_latency_ms_median") is not None]
-    if not rows:
-        return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "hb_timeout_ms", "hb_interval_ms", "repl_mode",
-            "median_detection_ms", "iqr_detection_ms", "n_trials",
-            "fault_type", "fd_algo", "config", "workload_zipf_alpha",
-        ])
-        for r in sorted(rows, key=lambda x: (x["hb_timeout_ms"], x["hb_interval_ms"])):
-            writer.writerow([
-                r["hb_timeout_ms"], r["hb_interval_ms"], r["repl_mode"],
-                r["detection_latency_ms_median"],
-                r["detection_latency_ms_iqr"],
-                r["n_trials"],
-                r.get("fault_type", ""),
-                r.get("fd_algo", ""),
-                r.get("config", ""),
-                r.get("workload_zipf_alpha", 0.0),
-            ])
-    print(f"Wrote {path}")
-
+def write_plot_csvs(aggregated: List[Dict], heatmap_path: Path, scatter_path: Path):
+    """
+    Write the heatmap- and scatter-format CSVs used for plotting.
 
-def write_scatter_csv(aggregated: List[Dict], path: Path):
-    """Write scatter-format CSV for missed-heartbeats vs detection latency."""
-    rows = [r for r in aggregated
-            if r.get("missed") is not None and r.get("detection_latency_ms_median") is not None]
-    if not rows:
-        return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "missed", "hb_interval_ms", "hb_timeout_ms", "repl_mode",
-            "median_detection_ms", "iqr_detection_ms", "n_trials",
-            "fault_type", "fd_algo", "config", "workload_zipf_alpha",
-        ])
-        for r in sorted(rows, key=lambda x: x["missed"]):
-            writer.writerow([
-                r["missed"], r["hb_interval_ms"], r["hb_timeout_ms"], r["repl_mode"],
-                r["detection_latency_ms_median"],
-                r["detection_latency_ms_iqr"],
-                r["n_trials"],
-                r.get("fault_type", ""),
-                r.get("fd_algo", ""),
-                r.get("config", ""),
-                r.get("workload_zipf_alpha", 0.0),
-            ])
-    print(f"Wrote {path}")
+    Both files share most columns, so their rows are built in one pass over
+    the aggregated rows and only the sort orders differ.
+    """
+    heatmap_tuples, scatter_tuples = [], []
+    for r in aggregated:
+        if r.get("detection_latency_ms_median") is None:
+            continue
+        common = (
+            r["repl_mode"],
+            r["detection_latency_ms_median"],
+            r["detection_latency_ms_iqr"],
+            r["n_trials"],
+            r.get("fault_type", ""),
+            r.get("fd_algo", ""),
+            r.get("config", ""),
+            r.get("workload_zipf_alpha", 0.0),
+        )
+        heatmap_tuples.append((r["hb_timeout_ms"], r["hb_interval_ms"]) + common)
+        if r.get("missed") is not None:
+            scatter_tuples.append((r["missed"], r["hb_interval_ms"], r["hb_timeout_ms"]) + common)
+
+    common_header = [
+        "repl_mode", "median_detection_ms", "iqr_detection_ms", "n_trials",
+        "fault_type", "fd_algo", "config", "workload_zipf_alpha",
+    ]
+    if heatmap_tuples:
+        heatmap_tuples.sort(key=lambda t: (t[0], t[1]))
+        heatmap_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(heatmap_path, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(["hb_timeout_ms", "hb_interval_ms"] + common_header)
+            writer.writerows(heatmap_tuples)
+        print(f"Wrote {heatmap_path}")
+    if scatter_tuples:
+        scatter_tuples.sort(key=lambda t: t[0])
+        scatter_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(scatter_path, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(["missed", "hb_interval_ms", "hb_timeout_ms"] + common_header)
+            writer.writerows(scatter_tuples)
+        print(f"Wrote {scatter_path}")
 
 
 def main():
@@ -345,6 +525,10 @@ def main():
     parser.add_argument("--output", type=Path,
                         default=Path(__file__).resolve().parent.parent / "output",
                         help="Output directory (contains logs/ and results/)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes for log parsing (default: CPU count; 1 = serial)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-parse every trial instead of reusing output/.cache results")
     args = parser.parse_args()
 
     logs_dir = args.output / "logs"
@@ -355,18 +539,11 @@ def main():
         sys.exit(1)
 
     # Discover all trial directories
-    all_metrics = []
-    for config_dir in sorted(logs_dir.iterdir()):
-        if not config_dir.is_dir():
-            continue
-        for trial_dir in sorted(config_dir.iterdir()):
-            if not trial_dir.is_dir():
-                continue
-            try:
-                metrics = compute_trial_metrics(trial_dir)
-                all_metrics.append(metrics)
-            except Exception as e:
-                print(f"  Error processing {trial_dir}: {e}", file=sys.stderr)
+    trial_dirs = [trial_dir
+                  for config_dir in list_subdirs(logs_dir)
+                  for trial_dir in list_subdirs(config_dir)]
+    cache_path = None if args.no_cache else args.output / ".cache" / "trial_metrics.pkl"
+    all_metrics = compute_all_trial_metrics(trial_dirs, jobs=args.jobs, cache_path=cache_path)
 
     if not all_metrics:
         print("No trial data found.", file=sys.stderr)
@@ -382,8 +559,7 @@ def main():
     write_aggregate_csv(aggregated, results_dir / "aggregate.csv")
 
     # Specialized CSVs for plotting
-    write_heatmap_csv(aggregated, results_dir / "heatmap.csv")
-    write_scatter_csv(aggregated, results_dir / "scatter.csv")
+    write_plot_csvs(aggregated, results_dir / "heatmap.csv", results_dir / "scatter.csv")
 
 
 if __name__ == "__main__":
@@ -9,26 +9,116 @@ Can be used standalone for debugging or as a library imported by compute_metrics
 """
 
 import json
+import mmap
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json accepts bytes too
+    _loads = json.loads
+
+
+def _matching_line_spans(data, needles: List[bytes]) -> List[Tuple[int, int]]:
+    """Return sorted (start, end) spans of the lines in data containing any needle."""
+    spans = set()
+    for needle in needles:
+        idx = data.find(needle)
+        while idx != -1:
+            start = data.rfind(b"\n", 0, idx) + 1
+            end = data.find(b"\n", idx)
+            if end == -1:
+                end = len(data)
+            spans.add((start, end))
+            idx = data.find(needle, end)
+    return sorted(spans)
+
+
+def load_jsonl(path: Path, events: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Load all valid JSON lines from a JSONL file.
 
-def load_jsonl(path: Path) -> List[Dict[str, Any]]:
-    """Load all valid JSON lines from a JSONL file."""
-    events = []
+    If events is given, only events of those types are returned. The file is
+    then memory-mapped and searched for each quoted event name, and only the
+    enclosing lines are decoded; other lines are never split out or checked.
+    """
+    result = []
     if not path.exists():
-        return events
-    with open(path) as f:
-        for line_num, line in enumerate(f, 1):
+        return result
+    if events is None:
+        for line_num, line in enumerate(path.read_bytes().split(b"\n"), 1):
             line = line.strip()
             if not line:
                 continue
             try:
-                events.append(json.loads(line))
-            except json.JSONDecodeError:
+                result.append(_loads(line))
+            except ValueError:
+                print(f"  Warning: invalid JSON at {path}:{line_num}", file=sys.stderr)
+        return result
+
+    wanted = set(events)
+    if path.stat().st_size == 0:
+        return result
+    with open(path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start, end in _matching_line_spans(mm, [f'"{e}"'.encode() for e in wanted]):
+            try:
+                evt = _loads(mm[start:end])
+            except ValueError:
+                line_num = mm[:start].count(b"\n") + 1
                 print(f"  Warning: invalid JSON at {path}:{line_num}", file=sys.stderr)
-    return events
+                continue
+            if isinstance(evt, dict) and evt.get("event") in wanted:
+                result.append(evt)
+    return result
+
+
+def load_last_event(path: Path, event_type: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the last event of a given type from a JSONL file without parsing
+    the whole file.
+
+    The file is memory-mapped and searched backwards for the quoted event
+    name; only the enclosing line is decoded. Lines where the name appears
+    in some other field are skipped and the search continues further up.
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+    needle = f'"{event_type}"'.encode()
+    with open(path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = len(mm)
+        while True:
+            idx = mm.rfind(needle, 0, end)
+            if idx == -1:
+                return None
+            start = mm.rfind(b"\n", 0, idx) + 1
+            stop = mm.find(b"\n", idx)
+            if stop == -1:
+                stop = len(mm)
+            try:
+                evt = _loads(mm[start:stop])
+            except ValueError:
+                evt = None
+            if isinstance(evt, dict) and evt.get("event") == event_type:
+                return evt
+            end = start
+
+
+def list_subdirs(path: Path) -> List[Path]:
+    """
+    List the immediate subdirectories of a directory, sorted by name.
+
+    Uses os.scandir so the directory check comes from the cached d_type
+    rather than a stat() per entry.
+    """
+    with os.scandir(path) as it:
+        entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+    entries.sort(key=lambda e: e.name)
+    return [Path(e.path) for e in entries]
 
 
 def load_trial_logs(trial_dir: Path) -> Dict[str, List[Dict]]:
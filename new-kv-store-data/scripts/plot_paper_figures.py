@@ -12,9 +12,14 @@ Requirements implemented:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
+# Select the non-interactive backend before pyplot is imported so no GUI
+# backend is probed; an explicit MPLBACKEND from the caller still wins.
+os.environ.setdefault("MPLBACKEND", "Agg")
+
 import matplotlib
 import numpy as np
 import pandas as pd
@@ -408,10 +413,9 @@ def figure3_heatmap_parameter_sweep(agg: pd.DataFrame, out_dir: Path) -> str:
     for k, (ax, mode) in enumerate(zip(axes, modes)):
         matrix = np.full((len(timeouts), len(intervals)), np.nan)
         sub = df[df["repl_mode"] == mode]
-        for _, row in sub.iterrows():
-            i = timeouts.index(int(row["hb_timeout_ms"]))
-            j = intervals.index(int(row["hb_interval_ms"]))
-            matrix[i, j] = float(row["detection_latency_ms_median"])
+        rows_i = np.searchsorted(timeouts, sub["hb_timeout_ms"].astype(int).to_numpy())
+        cols_j = np.searchsorted(intervals, sub["hb_interval_ms"].astype(int).to_numpy())
+        matrix[rows_i, cols_j] = sub["detection_latency_ms_median"].astype(float).to_numpy()
 
         im = ax.imshow(matrix, cmap=cmap, origin="lower", vmin=vmin, vmax=vmax, aspect="auto")
         ax.set_title(f"mode={mode}")
@@ -428,38 +432,36 @@ def figure3_heatmap_parameter_sweep(agg: pd.DataFrame, out_dir: Path) -> str:
 
         # annotate every populated cell
         cell_fontsize = 9 if (len(intervals) * len(timeouts) > 9) else 10
-        for i in range(len(timeouts)):
-            for j in range(len(intervals)):
-                val = matrix[i, j]
-                if np.isnan(val):
-                    ax.annotate(
-                        "N/A",
-                        xy=(j, i),
-                        xytext=(0, 0),
-                        textcoords="offset points",
-                        ha="center",
-                        va="center",
-                        fontsize=10,
-                        color="#666666",
-                        fontstyle="italic",
-                        bbox={"boxstyle": "round,pad=0.15", "fc": "white", "ec": "#BBBBBB", "alpha": 0.9},
-                    )
-                    continue
-                text = f"{val:.1f}"
-                color = "white" if val > (vmin + vmax) / 2 else "black"
+        for (i, j), val in np.ndenumerate(matrix):
+            if np.isnan(val):
                 ax.annotate(
-                    text,
+                    "N/A",
                     xy=(j, i),
                     xytext=(0, 0),
                     textcoords="offset points",
                     ha="center",
                     va="center",
-                    fontsize=cell_fontsize,
-                    color=color,
-                    bbox={"boxstyle": "round,pad=0.15", "fc": "white", "ec": "none", "alpha": 0.55}
-                    if color == "black"
-                    else None,
+                    fontsize=10,
+                    color="#666666",
+                    fontstyle="italic",
+                    bbox={"boxstyle": "round,pad=0.15", "fc": "white", "ec": "#BBBBBB", "alpha": 0.9},
                 )
+                continue
+            text = f"{val:.1f}"
+            color = "white" if val > (vmin + vmax) / 2 else "black"
+            ax.annotate(
+                text,
+                xy=(j, i),
+                xytext=(0, 0),
+                textcoords="offset points",
+                ha="center",
+                va="center",
+                fontsize=cell_fontsize,
+                color=color,
+                bbox={"boxstyle": "round,pad=0.15", "fc": "white", "ec": "none", "alpha": 0.55}
+                if color == "black"
+                else None,
+            )
 
     # Reserve dedicated space for colorbar to avoid overlap with right-most panel.
     fig.subplots_adjust(right=0.86)
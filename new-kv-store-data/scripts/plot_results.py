@@ -199,9 +199,12 @@ def main():
                         elinewidth=0.8,
                         zorder=1)
 
-            # Plot each point with its own marker shape for print readability
-            for x, y, c, m in zip(missed, median_det, colors, markers):
-                ax.scatter(x, y, c=c, marker=m, s=55,
+            # One scatter call per marker shape (shapes kept for print readability)
+            missed_arr, det_arr = np.asarray(missed), np.asarray(median_det)
+            colors_arr, markers_arr = np.asarray(colors), np.asarray(markers)
+            for m in dict.fromkeys(markers):
+                sel = markers_arr == m
+                ax.scatter(missed_arr[sel], det_arr[sel], c=colors_arr[sel], marker=m, s=55,
                            edgecolors="white", linewidths=0.6, zorder=2)
 
             # Manual legend entries
@@ -233,21 +236,23 @@ def main():
 
     # ── 2. Heatmap: detection latency by (hb_interval, hb_timeout) ───────────
     if heatmap_data:
-        timeouts  = sorted({safe_float(r["hb_timeout_ms"])  for r in heatmap_data})
-        intervals = sorted({safe_float(r["hb_interval_ms"]) for r in heatmap_data})
-        timeouts  = [t for t in timeouts  if t is not None]
-        intervals = [i for i in intervals if i is not None]
+        cells = np.array([(safe_float(r["hb_timeout_ms"], np.nan),
+                           safe_float(r["hb_interval_ms"], np.nan),
+                           safe_float(r["median_detection_ms"], np.nan))
+                          for r in heatmap_data], dtype=float).reshape(-1, 3)
+        cells = cells[~np.isnan(cells).any(axis=1)]
+        # Unique axis values plus each row's cell index, in one pass per axis
+        timeouts,  ti = np.unique(cells[:, 0], return_inverse=True)
+        intervals, ii = np.unique(cells[:, 1], return_inverse=True)
 
         if len(timeouts) > 1 or len(intervals) > 1:
-            Z = np.full((len(timeouts), len(intervals)), np.nan)
-            for r in heatmap_data:
-                to_val  = safe_float(r["hb_timeout_ms"])
-                iv_val  = safe_float(r["hb_interval_ms"])
-                med_val = safe_float(r["median_detection_ms"])
-                if to_val is not None and iv_val is not None and med_val is not None:
-                    ti = timeouts.index(to_val)
-                    ii = intervals.index(iv_val)
-                    Z[ti, ii] = med_val if np.isnan(Z[ti, ii]) else (Z[ti, ii] + med_val) / 2
+            # Cell value = mean median latency over all rows in that cell
+            sums   = np.zeros((len(timeouts), len(intervals)))
+            counts = np.zeros_like(sums)
+            np.add.at(sums, (ti, ii), cells[:, 2])
+            np.add.at(counts, (ti, ii), 1)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                Z = np.where(counts > 0, sums / counts, np.nan)
 
             fig, ax = plt.subplots(figsize=(5.0, 4.0))
             # Use a perceptually uniform sequential colormap
@@ -269,16 +274,14 @@ def main():
             # Annotate cells
             vmin, vmax = np.nanmin(Z), np.nanmax(Z)
             midpoint   = (vmin + vmax) / 2
-            for i in range(len(timeouts)):
-                for j in range(len(intervals)):
-                    v = Z[i, j]
-                    if not np.isnan(v):
-                        text_color = "white" if v > midpoint else "black"
-                        ax.text(j, i, f"{v:.0f}",
-                                ha="center", va="center",
-                                color=text_color,
-                                fontsize=10,
-                                fontweight="bold")
+            for (i, j), v in np.ndenumerate(Z):
+                if np.isfinite(v):
+                    text_color = "white" if v > midpoint else "black"
+                    ax.text(j, i, f"{v:.0f}",
+                            ha="center", va="center",
+                            color=text_color,
+                            fontsize=10,
+                            fontweight="bold")
 
             cbar = plt.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
             cbar.set_label("Detection Latency (ms)", labelpad=6)
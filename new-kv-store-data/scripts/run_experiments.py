@@ -17,20 +17,44 @@ After all trials: runs compute_metrics.py and plot_results.py.
 """
 
 import json
+import mmap
 import os
+import queue
+import selectors
 import shutil
 import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # orjson is optional; stdlib json accepts bytes too
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+try:
+    import inotify_simple
+except ImportError:  # Linux-only; other platforms poll the log instead
+    inotify_simple = None
 
 ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = ROOT / "config" / "experiment_configs.json"
 OUTPUT_DIR = ROOT / "output"
 
+# Environment snapshot shared by all trials; each trial only layers RUN_ID
+# on top instead of copying os.environ again. Treat as read-only.
+BASE_ENV = dict(os.environ)
+
 
 def wall_ms() -> int:
     return int(time.time() * 1000)
@@ -66,8 +90,8 @@ def resolve_binaries(
 
 def wait_for_port(port: int, timeout: float = 5.0) -> bool:
     """Wait until a TCP port is accepting connections."""
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             s.settimeout(0.1)
@@ -103,32 +127,132 @@ def send_fault_delay(port: int, delay_ms: int) -> bool:
     return False
 
 
-def wait_for_declared_dead(log_path: Path, run_id: str, t_fail: int,
-                           timeout_sec: float = 15.0):
-    """Poll the primary's log for declared_dead strictly after fault time (t_fail)."""
-    deadline = time.time() + timeout_sec
-    while time.time() < deadline:
-        if log_path.exists():
-            try:
-                with open(log_path) as f:
-                    for line in f:
-                        try:
-                            obj = json.loads(line)
-                            if (obj.get("event") == "declared_dead" and
-                                    obj.get("run_id") == run_id):
-                                ts = obj.get("ts_ms")
-                                # Strictly after fault: avoids negative detection_latency
-                                # when a spurious or earlier-phase line is mis-attributed.
-                                if ts is not None and ts >= t_fail:
-                                    return ts
-                        except json.JSONDecodeError:
-                            continue
-            except OSError:
-                pass
-        time.sleep(0.05)
+def _scan_declared_dead(chunk: bytes, run_id: str, t_fail: int) -> Optional[int]:
+    """Return ts_ms of the first matching declared_dead in a block of complete lines."""
+    for line in chunk.split(b"\n"):
+        # Cheap substring test first; only candidate lines are JSON-decoded
+        if b'"declared_dead"' not in line:
+            continue
+        try:
+            obj = _loads(line)
+        except ValueError:
+            continue
+        if (obj.get("event") == "declared_dead" and
+                obj.get("run_id") == run_id):
+            ts = obj.get("ts_ms")
+            # Strictly after fault: avoids negative detection_latency
+            # when a spurious or earlier-phase line is mis-attributed.
+            if ts is not None and ts >= t_fail:
+                return ts
     return None
 
 
+def _open_log_watch(log_path: Path):
+    """Return an inotify watch on the log's directory, or None to fall back to polling."""
+    if inotify_simple is None:
+        return None
+    try:
+        inotify = inotify_simple.INotify()
+        inotify.add_watch(str(log_path.parent),
+                          inotify_simple.flags.MODIFY | inotify_simple.flags.CREATE)
+        return inotify
+    except OSError:
+        return None
+
+
+def snapshot_log(log_path: Path) -> Tuple[bool, int]:
+    """
+    Inspect a node log once, in place, at the end of warmup.
+
+    Returns (saw_heartbeat, offset) where offset is just past the last complete
+    line, so a later scan can skip everything written during warmup.
+    """
+    try:
+        with open(log_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False, 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(b'"hb_ping_sent"') != -1, mm.rfind(b"\n") + 1
+    except OSError:
+        return False, 0
+
+
+def _open_pidfd(proc: Optional[subprocess.Popen]) -> Optional[int]:
+    """Return a pidfd that becomes readable when proc exits, or None if unsupported."""
+    if proc is None or not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(proc.pid)
+    except OSError:
+        return None
+
+
+def wait_for_declared_dead(log_path: Path, run_id: str, t_fail: int,
+                           timeout_sec: float = 15.0, start_offset: int = 0,
+                           proc: Optional[subprocess.Popen] = None,
+                           stop: Optional[threading.Event] = None):
+    """
+    Wait for declared_dead in the primary's log strictly after fault time (t_fail).
+
+    The log is opened once and scanning starts at start_offset (a line
+    boundary); each check then reads only newly appended bytes from the same
+    file object, so every line is decoded at most once. With inotify available
+    the wait sleeps in select() until the log is written; otherwise it polls
+    every 50 ms.
+    If proc (the primary) is given and exits, the log is read one last time and
+    the wait gives up early; a pidfd wakes the select() on Linux. Setting stop
+    also gives up early, within one wakeup.
+    """
+    deadline = time.monotonic() + timeout_sec
+    f = None
+    buf = b""  # trailing partial line carried over to the next read
+    inotify = _open_log_watch(log_path)
+    pidfd = _open_pidfd(proc)
+    sel = selectors.DefaultSelector()
+    if inotify is not None:
+        sel.register(inotify.fileno(), selectors.EVENT_READ, "log")
+    if pidfd is not None:
+        sel.register(pidfd, selectors.EVENT_READ, "exit")
+    try:
+        while True:
+            # Checked before reading so lines written just before exit are seen
+            exited = proc is not None and proc.poll() is not None
+            if f is None:
+                try:
+                    f = open(log_path, "rb")
+                    f.seek(start_offset)
+                except OSError:
+                    f = None  # not created yet; retry on the next wakeup
+            if f is not None:
+                buf += f.read()
+                end = buf.rfind(b"\n") + 1
+                if end:
+                    ts = _scan_declared_dead(buf[:end], run_id, t_fail)
+                    if ts is not None:
+                        return ts
+                    buf = buf[end:]
+            remaining = deadline - time.monotonic()
+            if exited or remaining <= 0 or (stop is not None and stop.is_set()):
+                return None
+            if inotify is not None:
+                # Bounded wait so a missed event degrades to slow polling
+                for key, _ in sel.select(timeout=min(remaining, 0.5)):
+                    if key.data == "log":
+                        inotify.read(timeout=0)  # drain queued events
+            elif pidfd is not None:
+                sel.select(timeout=min(remaining, 0.05))
+            else:
+                time.sleep(0.05)
+    finally:
+        if f is not None:
+            f.close()
+        sel.close()
+        if pidfd is not None:
+            os.close(pidfd)
+        if inotify is not None:
+            inotify.close()
+
+
 def kill_process(proc: subprocess.Popen, use_sigkill: bool = True):
     """Kill a process reliably."""
     if proc.poll() is not None:
@@ -146,6 +270,18 @@ def kill_process(proc: subprocess.Popen, use_sigkill: bool = True):
         pass
 
 
+class TrialAborted(Exception):
+    """Raised inside a trial once the sweep's stop event is set."""
+
+
+def _sleep(seconds: float, stop: Optional[threading.Event]):
+    """time.sleep() that raises TrialAborted as soon as stop is set."""
+    if stop is None:
+        time.sleep(seconds)
+    elif stop.wait(seconds):
+        raise TrialAborted()
+
+
 def run_one_trial(
     config: dict,
     base: dict,
@@ -153,8 +289,16 @@ def run_one_trial(
     trial_dir: Path,
     kvnode_bin: Path,
     workload_bin: Path,
+    port_offset: int = 0,
+    stop: Optional[threading.Event] = None,
 ):
-    """Run a single experiment trial."""
+    """
+    Run a single experiment trial.
+
+    port_offset is added to both node ports so concurrently running trials
+    do not collide. If stop is set while the trial runs, it raises
+    TrialAborted after its processes have been killed.
+    """
     name = config["name"]
     hb_interval = config["hb_interval_ms"]
     hb_timeout = config["hb_timeout_ms"]
@@ -163,8 +307,8 @@ def run_one_trial(
     fd_algo = config.get("fd_algo", "fixed")
     phi_threshold = config.get("phi_threshold", 8.0)
 
-    port0 = base.get("node_ports", [9100, 9101])[0]
-    port1 = base.get("node_ports", [9100, 9101])[1]
+    port0 = base.get("node_ports", [9100, 9101])[0] + port_offset
+    port1 = base.get("node_ports", [9100, 9101])[1] + port_offset
     warmup_sec = base.get("warmup_sec", 3.0)
     fault_time_sec = base.get("fault_time_sec", 5.0)
     experiment_duration = base.get("experiment_duration_sec", 10.0)
@@ -189,20 +333,26 @@ def run_one_trial(
     wal_n0 = trial_dir / "node0.wal"
     wal_n1 = trial_dir / "node1.wal"
 
-    env = os.environ.copy()
-    env["RUN_ID"] = run_id
+    env = {**BASE_ENV, "RUN_ID": run_id}
+
+    # Arguments shared by both node command lines
+    kvnode = str(kvnode_bin)
+    node_common = [
+        "--run_id", run_id,
+        "--hb_interval_ms", str(hb_interval),
+        "--hb_timeout_ms", str(hb_timeout),
+    ]
 
     procs = []
+    injector_events = []
 
     try:
         # 1. Start secondary (Node 1)
         n1_cmd = [
-            str(kvnode_bin),
+            kvnode,
             "--id", "node1", "--port", str(port1),
             "--log_path", str(log_n1),
-            "--run_id", run_id,
-            "--hb_interval_ms", str(hb_interval),
-            "--hb_timeout_ms", str(hb_timeout),
+            *node_common,
             "--wal_path", str(wal_n1),
         ]
         proc_n1 = subprocess.Popen(
@@ -217,13 +367,11 @@ def run_one_trial(
 
         # 2. Start primary (Node 0)
         n0_cmd = [
-            str(kvnode_bin),
+            kvnode,
             "--id", "node0", "--port", str(port0), "--primary",
             "--peer", f"127.0.0.1:{port1}",
             "--log_path", str(log_n0),
-            "--run_id", run_id,
-            "--hb_interval_ms", str(hb_interval),
-            "--hb_timeout_ms", str(hb_timeout),
+            *node_common,
             "--repl_mode", repl_mode,
             "--wal_path", str(wal_n0),
             "--fd_algo", fd_algo,
@@ -260,9 +408,15 @@ def run_one_trial(
         procs.append(proc_wl)
 
         # 4. Warmup
-        time.sleep(warmup_sec)
+        _sleep(warmup_sec, stop)
 
         # 5. Inject fault
+        # Snapshot Node 0's log before taking t_fault: confirms heartbeats ran
+        # during warmup, and lets detection skip the warmup lines. Lines past
+        # the snapshot may predate t_fault but are never skipped.
+        saw_hb, log_n0_offset = snapshot_log(log_n0)
+        if not saw_hb:
+            print("  Warning: no heartbeats from Node 0 during warmup", file=sys.stderr)
         t_fault = wall_ms()
         injector_events = [{
             "event": "run_start",
@@ -310,7 +464,8 @@ def run_one_trial(
         post_fault_sec = experiment_duration - fault_time_sec
         t_detect = wait_for_declared_dead(
             log_n0, run_id, t_fault,
-            timeout_sec=max(10.0, hb_timeout / 1000.0 * 5 + 5.0))
+            timeout_sec=max(10.0, hb_timeout / 1000.0 * 5 + 5.0),
+            start_offset=log_n0_offset, proc=proc_n0, stop=stop)
 
         detection_latency_ms = (t_detect - t_fault) if t_detect is not None else None
         if detection_latency_ms is not None and detection_latency_ms < 0:
@@ -327,7 +482,7 @@ def run_one_trial(
 
         # Wait remaining time for workload to continue through failure
         if post_fault_sec > 0:
-            time.sleep(max(0, post_fault_sec))
+            _sleep(max(0, post_fault_sec), stop)
 
     finally:
         # 7. Stop all processes
@@ -335,9 +490,8 @@ def run_one_trial(
             kill_process(proc, use_sigkill=False)
 
         # 8. Write injector log
-        with open(injector_log, "w") as f:
-            for evt in injector_events:
-                f.write(json.dumps(evt) + "\n")
+        with open(injector_log, "wb") as f:
+            f.write(b"".join(_dumps(evt) + b"\n" for evt in injector_events))
 
     result = {
         "run_id": run_id,
@@ -355,10 +509,114 @@ def run_one_trial(
         "t_detect_ms": t_detect,
         "detection_latency_ms": detection_latency_ms,
     }
-    print(f"  Trial {trial_num}: detection_latency_ms = {detection_latency_ms}")
+    print(f"  [{name}] Trial {trial_num}: detection_latency_ms = {detection_latency_ms}")
     return result
 
 
+def run_config_trials(
+    cfg: dict,
+    base: dict,
+    trials: int,
+    logs_dir: Path,
+    kvnode_bin: Path,
+    workload_bin: Path,
+    port_slots: "queue.Queue[int]",
+    stop: Optional[threading.Event] = None,
+) -> List[dict]:
+    """
+    Run all trials of one configuration back to back.
+
+    A port slot is taken from port_slots for the duration so that configs
+    running on other threads use disjoint node ports. Trials within a config
+    stay serial. Once stop is set, the running trial is aborted and no
+    further trials are started.
+    """
+    name = cfg["name"]
+    slot = port_slots.get()
+    port_offset = 2 * slot
+    results = []
+    try:
+        print(f"\n{'='*60}")
+        print(f"Config: {name} (hb_i={cfg['hb_interval_ms']} hb_t={cfg['hb_timeout_ms']} "
+              f"repl={cfg['repl_mode']} fault={cfg['fault_type']})")
+        print(f"{'='*60}")
+
+        for t in range(1, trials + 1):
+            if stop is not None and stop.is_set():
+                break
+            trial_dir = logs_dir / name / f"trial_{t}"
+            print(f"  [{name}] Starting trial {t}/{trials}...")
+            try:
+                result = run_one_trial(cfg, base, t, trial_dir, kvnode_bin, workload_bin,
+                                       port_offset=port_offset, stop=stop)
+                results.append(result)
+            except TrialAborted:
+                print(f"  [{name}] Trial {t} aborted", file=sys.stderr)
+                break
+            except Exception as e:
+                print(f"  [{name}] Trial {t} failed: {e}", file=sys.stderr)
+                results.append({
+                    "config": name, "trial": t, "error": str(e)
+                })
+            # Brief pause between trials for port cleanup
+            if stop is None:
+                time.sleep(1.0)
+            elif stop.wait(1.0):
+                break
+    finally:
+        port_slots.put(slot)
+    return results
+
+
+def run_all_configs(
+    configurations: List[dict],
+    base: dict,
+    trials: int,
+    logs_dir: Path,
+    kvnode_bin: Path,
+    workload_bin: Path,
+    parallel: int = 1,
+) -> List[dict]:
+    """
+    Run every configuration, up to parallel of them at a time.
+
+    Each concurrently running config holds its own port slot: slot k uses
+    node_ports + 2k, so parallel configs never share a listen port. Results
+    are returned in configuration order. With parallel == 1 the configs run
+    inline on the calling thread. Otherwise a KeyboardInterrupt cancels the
+    configs not yet started and aborts the running trials, whose cleanup
+    kills their nodes, before it is re-raised.
+    """
+    parallel = max(1, min(parallel, len(configurations)))
+    port_slots: "queue.Queue[int]" = queue.Queue()
+    for slot in range(parallel):
+        port_slots.put(slot)
+
+    all_results = []
+    if parallel == 1:
+        for cfg in configurations:
+            all_results.extend(run_config_trials(cfg, base, trials, logs_dir,
+                                                 kvnode_bin, workload_bin, port_slots))
+        return all_results
+
+    stop = threading.Event()
+    ex = ThreadPoolExecutor(max_workers=parallel)
+    try:
+        futures = [
+            ex.submit(run_config_trials, cfg, base, trials, logs_dir,
+                      kvnode_bin, workload_bin, port_slots, stop)
+            for cfg in configurations
+        ]
+        for fut in futures:
+            all_results.extend(fut.result())
+    except KeyboardInterrupt:
+        stop.set()
+        ex.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        ex.shutdown(wait=True)
+    return all_results
+
 
 def main():
     import argparse
@@ -371,6 +629,9 @@ def main():
                         help="Only run configs matching this name substring")
     parser.add_argument("--trials", type=int, default=None,
                         help="Override number of trials per config")
+    parser.add_argument("--parallel", type=int, default=1,
+                        help="Number of configs to run concurrently on disjoint ports "
+                             "(default 1; >1 shortens sweeps but adds CPU contention)")
     parser.add_argument("--skip-analysis", action="store_true",
                         help="Skip running compute_metrics.py and plot_results.py")
     parser.add_argument("--impl-root", type=Path, default=None,
@@ -412,28 +673,8 @@ def main():
     trials = args.trials or base.get("trials_per_config", 5)
     logs_dir = args.output / "logs"
 
-    all_results = []
-
-    for cfg in configurations:
-        name = cfg["name"]
-        print(f"\n{'='*60}")
-        print(f"Config: {name} (hb_i={cfg['hb_interval_ms']} hb_t={cfg['hb_timeout_ms']} "
-              f"repl={cfg['repl_mode']} fault={cfg['fault_type']})")
-        print(f"{'='*60}")
-
-        for t in range(1, trials + 1):
-            trial_dir = logs_dir / name / f"trial_{t}"
-            print(f"  Starting trial {t}/{trials}...")
-            try:
-                result = run_one_trial(cfg, base, t, trial_dir, kvnode_bin, workload_bin)
-                all_results.append(result)
-            except Exception as e:
-                print(f"  Trial {t} failed: {e}", file=sys.stderr)
-                all_results.append({
-                    "config": name, "trial": t, "error": str(e)
-                })
-            # Brief pause between trials for port cleanup
-            time.sleep(1.0)
+    all_results = run_all_configs(configurations, base, trials, logs_dir,
+                                  kvnode_bin, workload_bin, parallel=args.parallel)
 
     # Save all results
     results_dir = args.output / "results"
@@ -0,0 +1,78 @@
+"""Unit tests for compute_metrics aggregation helpers."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import compute_metrics  # noqa: E402
+from compute_metrics import GROUP_PERCENTILES, grouped_percentiles  # noqa: E402
+
+
+class TestGroupedPercentiles(unittest.TestCase):
+    def test_matches_per_group_percentile(self) -> None:
+        rng = np.random.default_rng(0)
+        group_ids = rng.integers(0, 4, size=200)
+        values = rng.normal(100.0, 25.0, size=200)
+        values[::7] = np.nan
+
+        out = grouped_percentiles(group_ids, values, 5)
+
+        for g in range(4):
+            vals = values[(group_ids == g) & ~np.isnan(values)]
+            np.testing.assert_allclose(out[g], np.percentile(vals, GROUP_PERCENTILES))
+        self.assertTrue(np.isnan(out[4]).all())
+
+    def test_all_missing(self) -> None:
+        out = grouped_percentiles(np.array([0, 1]), np.array([np.nan, np.nan]), 2)
+        self.assertTrue(np.isnan(out).all())
+
+
+class TestTrialMetricsCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.out = Path(self._tmp.name)
+        src = ROOT / "output" / "quick_test" / "logs" / "quick_no_repl"
+        for trial in ("trial_1", "trial_2"):
+            shutil.copytree(src / trial, self.out / "logs" / "quick_no_repl" / trial)
+        self.trial_dirs = sorted((self.out / "logs" / "quick_no_repl").iterdir())
+        self.cache_path = self.out / ".cache" / "trial_metrics.pkl"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def run_metrics(self):
+        return compute_metrics.compute_all_trial_metrics(
+            self.trial_dirs, jobs=1, cache_path=self.cache_path)
+
+    def test_unchanged_trials_are_not_reparsed(self) -> None:
+        first = self.run_metrics()
+        self.assertTrue(self.cache_path.is_file())
+
+        with mock.patch.object(compute_metrics, "compute_trial_metrics",
+                               side_effect=AssertionError("re-parsed")):
+            self.assertEqual(self.run_metrics(), first)
+
+    def test_changed_trial_is_reparsed(self) -> None:
+        self.run_metrics()
+        changed = self.trial_dirs[1] / "workload.jsonl"
+        st = changed.stat()
+        os.utime(changed, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        real = compute_metrics.compute_trial_metrics
+        with mock.patch.object(compute_metrics, "compute_trial_metrics",
+                               side_effect=real) as spy:
+            self.run_metrics()
+        self.assertEqual([c.args[0] for c in spy.call_args_list], [self.trial_dirs[1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
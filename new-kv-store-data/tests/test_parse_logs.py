@@ -0,0 +1,75 @@
+"""Unit tests for parse_logs helpers."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from parse_logs import load_jsonl, load_last_event  # noqa: E402
+
+
+class TestLoadJsonl(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "node0.jsonl"
+        self.path.write_text(
+            '{"event":"hb_ping_sent","ts_ms":1}\n'
+            '\n'
+            '{"event":"declared_dead","ts_ms":2}\r\n'
+            '{"event":"note","extra":{"msg":"declared_dead"}}\n'
+            '{"event":"repl_skipped",\n'
+        )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_all_events(self) -> None:
+        events = load_jsonl(self.path)
+        self.assertEqual([e["event"] for e in events], ["hb_ping_sent", "declared_dead", "note"])
+
+    def test_event_filter(self) -> None:
+        events = load_jsonl(self.path, events=("declared_dead",))
+        self.assertEqual(events, [{"event": "declared_dead", "ts_ms": 2}])
+
+
+class TestLoadLastEvent(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def write(self, name: str, text: str) -> Path:
+        path = self.tmp / name
+        path.write_text(text)
+        return path
+
+    def test_returns_last_matching_line(self) -> None:
+        path = self.write("injector.jsonl", (
+            '{"event": "run_start", "run_id": "r1"}\n'
+            '{"event": "detection_result", "detection_latency_ms": 10}\n'
+            '{"event": "detection_result", "detection_latency_ms": 20}\n'
+        ))
+        evt = load_last_event(path, "detection_result")
+        self.assertEqual(evt["detection_latency_ms"], 20)
+
+    def test_skips_name_in_other_field_and_bad_lines(self) -> None:
+        path = self.write("node0.jsonl", (
+            '{"event": "declared_dead", "ts_ms": 5}\n'
+            '{"event": "declared_dead", "ts_ms": \n'
+            '{"event": "note", "extra": {"msg": "declared_dead"}}'
+        ))
+        evt = load_last_event(path, "declared_dead")
+        self.assertEqual(evt["ts_ms"], 5)
+
+    def test_missing_or_empty_file(self) -> None:
+        self.assertIsNone(load_last_event(self.tmp / "absent.jsonl", "run_start"))
+        self.assertIsNone(load_last_event(self.write("e.jsonl", ""), "run_start"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+"""Unit tests for run_experiments helpers (no C++ build required)."""
+
+import contextlib
+import io
+import os
+import queue
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import run_experiments  # noqa: E402
+
+
+def _line(event: str, run_id: str, ts: int) -> str:
+    return f'{{"ts_ms":{ts},"node_id":"node0","run_id":"{run_id}","event":"{event}","extra":{{}}}}\n'
+
+
+class TestSnapshotLog(unittest.TestCase):
+    def test_offset_stops_at_last_complete_line(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            log = Path(tmp) / "node0.jsonl"
+            complete = _line("hb_ping_sent", "r1", 90)
+            log.write_text(complete + '{"ts_ms":91,')
+            self.assertEqual(run_experiments.snapshot_log(log), (True, len(complete)))
+
+    def test_missing_or_empty(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            log = Path(tmp) / "node0.jsonl"
+            self.assertEqual(run_experiments.snapshot_log(log), (False, 0))
+            log.write_text("")
+            self.assertEqual(run_experiments.snapshot_log(log), (False, 0))
+
+
+class TestWaitForDeclaredDead(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log = Path(self._tmp.name) / "node0.jsonl"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_detects_line_appended_while_waiting(self) -> None:
+        self.log.write_text(
+            _line("hb_ping_sent", "r1", 90)
+            + _line("declared_dead", "r1", 95)     # before the fault
+            + _line("declared_dead", "other", 150)  # different run
+        )
+
+        def append() -> None:
+            time.sleep(0.1)
+            with open(self.log, "a") as f:
+                # Write a line in two pieces to exercise partial-line handling
+                line = _line("declared_dead", "r1", 200)
+                f.write(line[:20])
+                f.flush()
+                time.sleep(0.05)
+                f.write(line[20:])
+
+        writer = threading.Thread(target=append)
+        writer.start()
+        ts = run_experiments.wait_for_declared_dead(self.log, "r1", 100, timeout_sec=5.0)
+        writer.join()
+        self.assertEqual(ts, 200)
+
+    def test_log_created_while_waiting(self) -> None:
+        def create() -> None:
+            time.sleep(0.1)
+            self.log.write_text(_line("declared_dead", "r1", 300))
+
+        writer = threading.Thread(target=create)
+        writer.start()
+        ts = run_experiments.wait_for_declared_dead(self.log, "r1", 100, timeout_sec=5.0)
+        writer.join()
+        self.assertEqual(ts, 300)
+
+    def test_start_offset_skips_earlier_lines(self) -> None:
+        first = _line("declared_dead", "r1", 150)
+        self.log.write_text(first + _line("declared_dead", "r1", 250))
+        ts = run_experiments.wait_for_declared_dead(
+            self.log, "r1", 100, timeout_sec=1.0, start_offset=len(first))
+        self.assertEqual(ts, 250)
+
+    def test_times_out(self) -> None:
+        self.log.write_text(_line("hb_ping_sent", "r1", 90))
+        start = time.time()
+        ts = run_experiments.wait_for_declared_dead(self.log, "r1", 100, timeout_sec=0.2)
+        self.assertIsNone(ts)
+        self.assertLess(time.time() - start, 2.0)
+
+    def test_returns_early_when_primary_exits(self) -> None:
+        self.log.write_text(_line("hb_ping_sent", "r1", 90))
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+        start = time.monotonic()
+        try:
+            ts = run_experiments.wait_for_declared_dead(
+                self.log, "r1", 100, timeout_sec=10.0, proc=proc)
+        finally:
+            proc.wait()
+        self.assertIsNone(ts)
+        self.assertLess(time.monotonic() - start, 5.0)
+
+    def test_polling_fallback(self) -> None:
+        self.log.write_text(_line("declared_dead", "r1", 120))
+        saved = run_experiments.inotify_simple
+        run_experiments.inotify_simple = None
+        try:
+            ts = run_experiments.wait_for_declared_dead(self.log, "r1", 100, timeout_sec=1.0)
+        finally:
+            run_experiments.inotify_simple = saved
+        self.assertEqual(ts, 120)
+
+
+class TestRunAllConfigs(unittest.TestCase):
+    """Config scheduling with run_one_trial replaced by a fake."""
+
+    def setUp(self) -> None:
+        self._real_run_one_trial = run_experiments.run_one_trial
+        run_experiments.run_one_trial = self._fake_trial
+        self.lock = threading.Lock()
+        self.active = {}  # config -> port_offset while its trial runs
+        self.overlaps = []
+        self.started = []
+        self.on_start = None
+
+    def tearDown(self) -> None:
+        run_experiments.run_one_trial = self._real_run_one_trial
+
+    def _fake_trial(self, cfg, base, t, trial_dir, kvnode_bin, workload_bin,
+                    port_offset=0, stop=None):
+        name = cfg["name"]
+        with self.lock:
+            if port_offset in self.active.values():
+                self.overlaps.append(name)
+            self.active[name] = port_offset
+            self.started.append(name)
+        try:
+            if self.on_start is not None:
+                self.on_start(name)
+            run_experiments._sleep(0.05 if self.on_start is None else 30.0, stop)
+        finally:
+            with self.lock:
+                del self.active[name]
+        return {"config": name, "trial": t, "port_offset": port_offset}
+
+    @staticmethod
+    def _configs(n):
+        return [{"name": f"c{i}", "hb_interval_ms": 100, "hb_timeout_ms": 500,
+                 "repl_mode": "async", "fault_type": "crash"} for i in range(n)]
+
+    def _run(self, n, parallel):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return run_experiments.run_all_configs(
+                self._configs(n), {}, 1, Path("unused"), Path("kvnode"), Path("workload"),
+                parallel=parallel)
+
+    def test_parallel_configs_use_disjoint_port_slots(self) -> None:
+        results = self._run(4, parallel=2)
+        self.assertEqual([r["config"] for r in results], ["c0", "c1", "c2", "c3"])
+        self.assertEqual(self.overlaps, [])
+        self.assertLessEqual({r["port_offset"] for r in results}, {0, 2})
+
+    def test_serial_runs_inline(self) -> None:
+        results = self._run(2, parallel=1)
+        self.assertEqual([r["port_offset"] for r in results], [0, 0])
+
+    def test_interrupt_aborts_running_and_cancels_queued(self) -> None:
+        # Delivered once the main thread is waiting on results, like a Ctrl-C
+        def interrupt(name):
+            if name == "c0":
+                threading.Timer(0.2, os.kill, (os.getpid(), signal.SIGINT)).start()
+
+        self.on_start = interrupt
+        old = signal.signal(signal.SIGINT, signal.default_int_handler)
+        try:
+            t0 = time.monotonic()
+            with self.assertRaises(KeyboardInterrupt):
+                self._run(4, parallel=2)
+            elapsed = time.monotonic() - t0
+        finally:
+            signal.signal(signal.SIGINT, old)
+        self.assertLess(elapsed, 5.0)
+        self.assertIn("c0", self.started)
+        self.assertLessEqual(set(self.started), {"c0", "c1"})
+        self.assertEqual(self.active, {})
+
+    def test_stop_set_runs_no_trials(self) -> None:
+        slots = queue.Queue()
+        slots.put(0)
+        stop = threading.Event()
+        stop.set()
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = run_experiments.run_config_trials(
+                self._configs(1)[0], {}, 3, Path("unused"), Path("kvnode"), Path("workload"),
+                slots, stop)
+        self.assertEqual(results, [])
+        self.assertEqual(slots.get_nowait(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()